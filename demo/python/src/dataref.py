@@ -11,13 +11,115 @@ Example:
     >>> reader = DataRefReader(client)
     >>> parking_brake = reader.read("sim/cockpit2/controls/parking_brake_ratio", "float")
     >>> print(f"Parking brake ratio: {parking_brake}")
+
+The AsyncDataRefReader reads data references through an AsyncUdpClient, so that multiple datarefs are read
+concurrently within one roundtrip.
 """
 
-from uuid import uuid4
+import asyncio
+import logging
+import re
+import time
+from functools import lru_cache
+from itertools import count
+
+from udp import AsyncUdpClient, UdpClient
+
+logger = logging.getLogger(__name__)
+
+# Request IDs only need to be unique among the requests of this process, so a counter is used instead of uuid4(),
+# which would read from the OS random source on every request
+_next_request_number = count().__next__
+
+
+def _next_request_id() -> bytes:
+    """
+    Generate the ID of the next request.
+
+    The plugin expects every request to start with a 32-character ID, so the counter is rendered as 32 hex digits.
+
+    Returns:
+        bytes: The encoded request ID, e.g. b"0000000000000000000000000000002a".
+    """
+    return f"{_next_request_number():032x}".encode()
+
+
+@lru_cache(maxsize=256)
+def _encode_read_request(type_str: str, data_ref: str) -> bytes:
+    """
+    Encode the part of a dataref read request that follows the request ID.
+
+    Only the request ID changes from one read of the same data reference to the next, so the rest of the request
+    is formatted and encoded once per data reference and cached.
+
+    Args:
+        type_str (str): Type of the data reference (e.g., "int", "float", "[int]", "[float]").
+        data_ref (str): Data reference name (e.g., "sim/cockpit2/controls/parking_brake_ratio").
+
+    Returns:
+        bytes: The encoded request without the leading request ID, e.g. b"|dataref|read|float|sim/...".
+    """
+    return f"|dataref|read|{type_str}|{data_ref}".encode()
+
+
+# Matches one record per line of a multi-record response, capturing the request ID (first field)
+# and the value (last field). Regular expressions work on any bytes-like object, so the records of a batch
+# are matched right inside the receive buffer of the client.
+_RESPONSE_RECORD_PATTERN = re.compile(rb"^([^|\n]*)\|[^\n]*\|([^|\n]*?)\s*$", re.MULTILINE)
 
-from termcolor import colored
 
-from udp import UdpClient
+def _parse_value(record: bytes) -> str:
+    """
+    Extract the value from a response record.
+
+    The value is the last field of the record, so it is cut off from the right without decoding
+    and splitting the whole record.
+
+    Args:
+        record (bytes): Response record, e.g. b"0000000000000000000000000000002a|200|OK|0.5".
+
+    Returns:
+        str: The value of the record, e.g. "0.5".
+    """
+    return record.rpartition(b"|")[2].strip().decode()
+
+
+def _parse_float(record: bytes) -> float | None:
+    """
+    Extract the value from a response record as a float.
+
+    float() accepts bytes, so the value is converted directly without being decoded to a string first.
+
+    Args:
+        record (bytes): Response record, e.g. b"0000000000000000000000000000002a|200|OK|0.5".
+
+    Returns:
+        float | None: The value of the record (e.g. 0.5), or None if its value is not a number
+                      (e.g. an error message).
+    """
+    value = record.rpartition(b"|")[2].strip()
+    try:
+        return float(value)
+    except ValueError:
+        logger.error("Dataref read response value is not a float: %s", value.decode())
+        return None
+
+
+def _parse_values(response: bytes | memoryview, requests: dict[bytes, str], values: dict[str, str | None]) -> None:
+    """
+    Store the values of the response records answering outstanding requests.
+
+    Every answered request is removed from the outstanding requests, records of unknown requests are ignored.
+
+    Args:
+        response (bytes | memoryview): Response with one or more newline-delimited records.
+        requests (dict[bytes, str]): Outstanding requests, mapping request ID to data reference name.
+        values (dict[str, str | None]): Values keyed by data reference name, updated in place.
+    """
+    for record in _RESPONSE_RECORD_PATTERN.finditer(response):
+        request_id, value = record.groups()
+        if (data_ref := requests.pop(request_id, None)) is not None:
+            values[data_ref] = value.decode()
 
 
 class DataRefReader:
@@ -69,15 +171,291 @@ class DataRefReader:
             ... else:
             ...     print("Failed to read altitude")
         """
-        data = f"{uuid4().hex}|dataref|read|{type_str}|{data_ref}"
-        print("=" * 100)
-        print(colored(f"Sending dataref read request: {data}", "cyan"))
-        response = self.client.send_and_recv(data.encode())
+        response = self._send_read_request(data_ref, type_str)
+        return _parse_value(response) if response else None
+
+    def read_float(self, data_ref: str) -> float | None:
+        """
+        Read a data reference of type "float" as a Python float.
+
+        Unlike read, the value is converted to a float straight from the response bytes.
+
+        Args:
+            data_ref (str): Data reference name (e.g., "sim/cockpit2/controls/parking_brake_ratio").
+
+        Returns:
+            float | None: The value of the data reference, or None if the request fails
+                          or the response does not carry a number.
+
+        Example:
+            >>> reader = DataRefReader(client)
+            >>> parking_brake = reader.read_float("sim/cockpit2/controls/parking_brake_ratio")
+        """
+        response = self._send_read_request(data_ref, "float")
+        return _parse_float(response) if response else None
+
+    def _send_read_request(self, data_ref: str, type_str: str) -> bytes | None:
+        """
+        Send a read request for a data reference and wait for its response.
+
+        Responses to other requests, e.g. late responses to an earlier read that timed out,
+        may still be queued on the socket, so responses are received until one carries the ID of this request.
+        All of them share one deadline, so dropped responses do not extend the wait beyond the client timeout.
+
+        Args:
+            data_ref (str): Data reference name (e.g., "sim/cockpit2/controls/parking_brake_ratio").
+            type_str (str): Type of the data reference (e.g., "int", "float", "[int]", "[float]").
+
+        Returns:
+            bytes | None: The response record, or None if no response was received.
+        """
+        request_id = _next_request_id()
+        data = request_id + _encode_read_request(type_str, data_ref)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending dataref read request: %s", data.decode())
+        deadline = time.monotonic() + self.client.timeout_secs
+        response = self.client.send_and_recv(data)
+        while response:
+            # Copied out of the receive buffer, so a single read allocates as many bytes objects as a plain recv().
+            # The record is short, and rpartition on bytes beats scanning it in place with a regular expression
+            record = bytes(response)
+            if record.startswith(request_id):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received dataref read response body: %s", record.decode().strip())
+                return record
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Dropped dataref read response of another request: %s", record.decode().strip())
+            response = self.client.recv(max(0.0, deadline - time.monotonic()))
+        logger.error("Dataref %s read failed: no response from server", data_ref)
+        return None
+
+    def read_many(self, data_refs: list[tuple[str, str]]) -> dict[str, str | None]:
+        """
+        Read multiple data references within a single request-response roundtrip.
+
+        The read requests are joined into newline-delimited datagrams no larger than the client can send
+        without IP fragmentation, so each datagram carries many requests instead of one.
+        All datagrams are sent before any response is received. The plugin answers each datagram
+        with newline-delimited response records, which are matched back to their requests by ID.
+
+        Args:
+            data_refs (list[tuple[str, str]]): Pairs of data reference name and type
+                                               (e.g., ("sim/cockpit2/controls/parking_brake_ratio", "float")).
+
+        Returns:
+            dict[str, str | None]: The string value of each data reference keyed by its name,
+                                   a value is None if no response record was received for it.
+
+        Example:
+            >>> reader = DataRefReader(client)
+            >>> values = reader.read_many([
+            ...     ("sim/cockpit2/controls/parking_brake_ratio", "float"),
+            ...     ("sim/cockpit2/electrical/battery_on", "[int]"),
+            ... ])
+            >>> print(values["sim/cockpit2/electrical/battery_on"])
+            [1, 1, 1]
+        """
+        values: dict[str, str | None] = dict.fromkeys((data_ref for data_ref, _ in data_refs), None)
+        requests: dict[bytes, str] = {}
+        batch: dict[bytes, str] = {}
+        batch_records: list[bytes] = []
+        max_batch_size = self.client.max_datagram_size()
+        # Size of the joined batch, the first record is not preceded by a newline
+        batch_size = -1
+        for data_ref, type_str in data_refs:
+            request_id = _next_request_id()
+            record = request_id + _encode_read_request(type_str, data_ref)
+            if batch and batch_size + 1 + len(record) > max_batch_size:
+                self._send_batch(batch_records, batch, requests)
+                batch, batch_records, batch_size = {}, [], -1
+            batch[request_id] = data_ref
+            batch_records.append(record)
+            batch_size += 1 + len(record)
+        if batch:
+            self._send_batch(batch_records, batch, requests)
+        self._recv_values(requests, values)
+        return values
+
+    def _send_batch(self, records: list[bytes], batch: dict[bytes, str], requests: dict[bytes, str]) -> None:
+        """
+        Send several request records in one newline-delimited datagram.
+
+        Args:
+            records (list[bytes]): Encoded request records of the batch.
+            batch (dict[bytes, str]): Requests of the batch, mapping request ID to data reference name.
+            requests (dict[bytes, str]): Outstanding requests, the batch is added if it was sent.
+        """
+        data = b"\n".join(records)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending dataref batch read request:\n%s", data.decode())
+        if self.client.send(data):
+            requests.update(batch)
+
+    def _recv_values(self, requests: dict[bytes, str], values: dict[str, str | None]) -> None:
+        """
+        Receive responses until every outstanding request is answered or the client timeout has passed.
+
+        Args:
+            requests (dict[bytes, str]): Outstanding requests, mapping request ID to data reference name.
+            values (dict[str, str | None]): Values keyed by data reference name, updated in place.
+        """
+        deadline = time.monotonic() + self.client.timeout_secs
+        while requests:
+            response = self.client.recv(max(0.0, deadline - time.monotonic()))
+            if not response:
+                logger.error("Dataref read failed: %d responses missing from server", len(requests))
+                return
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received dataref read response body:\n%s", str(response, "utf-8").strip())
+            _parse_values(response, requests, values)
+
+    def read_pipelined(self, data_refs: list[tuple[str, str]]) -> dict[str, str | None]:
+        """
+        Read multiple data references by sending all requests before receiving any response.
+
+        Each data reference is requested in its own datagram, but no request waits for the response
+        of the previous one, so the whole batch takes about one roundtrip. Responses may arrive in any order
+        and are matched back to their requests by ID. Unlike read_many, this does not rely on the plugin
+        accepting several requests in one datagram.
+
+        Args:
+            data_refs (list[tuple[str, str]]): Pairs of data reference name and type
+                                               (e.g., ("sim/cockpit2/controls/parking_brake_ratio", "float")).
+
+        Returns:
+            dict[str, str | None]: The string value of each data reference keyed by its name,
+                                   a value is None if no response was received for it.
+
+        Example:
+            >>> reader = DataRefReader(client)
+            >>> values = reader.read_pipelined([
+            ...     ("sim/cockpit2/controls/parking_brake_ratio", "float"),
+            ...     ("sim/cockpit2/electrical/battery_on", "[int]"),
+            ... ])
+        """
+        values: dict[str, str | None] = dict.fromkeys((data_ref for data_ref, _ in data_refs), None)
+        requests: dict[bytes, str] = {}
+        # Bound once outside the per-dataref loop
+        send = self.client.send
+        for data_ref, type_str in data_refs:
+            request_id = _next_request_id()
+            data = request_id + _encode_read_request(type_str, data_ref)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending dataref read request: %s", data.decode())
+            if send(data):
+                requests[request_id] = data_ref
+        self._recv_values(requests, values)
+        return values
+
+
+class AsyncDataRefReader:
+    """
+    asyncio DataRefReader class for XPlane UDP bridge plugin.
+
+    This class provides coroutines to read data references from XPlane through the UDP bridge plugin.
+    Reads do not wait for each other, so reading many data references costs about one roundtrip.
+
+    Attributes:
+        client (AsyncUdpClient): asyncio UDP client instance used for communication with the XPlane plugin.
+    """
+
+    def __init__(self, client: AsyncUdpClient):
+        """
+        Initialize AsyncDataRefReader with an asyncio UDP client.
+
+        Args:
+            client (AsyncUdpClient): asyncio UDP client instance for communication with the XPlane plugin.
+
+        Example:
+            >>> from udp import AsyncUdpClient
+            >>> client = await AsyncUdpClient.create("127.0.0.1", 49000)
+            >>> reader = AsyncDataRefReader(client)
+        """
+        self.client = client
+
+    async def read(self, data_ref: str, type_str: str) -> str | None:
+        """
+        Read a data reference as a specified value type.
+
+        Behaves like DataRefReader.read, except that other reads can run while this one awaits its response.
+
+        Args:
+            data_ref (str): Data reference name (e.g., "sim/cockpit2/controls/parking_brake_ratio").
+            type_str (str): Type of the data reference (e.g., "int", "float", "[int]", "[float]").
+
+        Returns:
+            str | None: The string value of the data reference, or None if the request fails
+                       due to timeout or other communication issues.
+
+        Example:
+            >>> reader = AsyncDataRefReader(client)
+            >>> altitude = await reader.read("sim/cockpit2/gauges/indicators/altitude_ft_pilot", "float")
+        """
+        response = await self._send_read_request(data_ref, type_str)
+        return _parse_value(response) if response else None
+
+    async def read_float(self, data_ref: str) -> float | None:
+        """
+        Read a data reference of type "float" as a Python float.
+
+        Behaves like DataRefReader.read_float, except that other reads can run while this one awaits its response.
+
+        Args:
+            data_ref (str): Data reference name (e.g., "sim/cockpit2/controls/parking_brake_ratio").
+
+        Returns:
+            float | None: The value of the data reference, or None if the request fails
+                          or the response does not carry a number.
+
+        Example:
+            >>> reader = AsyncDataRefReader(client)
+            >>> parking_brake = await reader.read_float("sim/cockpit2/controls/parking_brake_ratio")
+        """
+        response = await self._send_read_request(data_ref, "float")
+        return _parse_float(response) if response else None
+
+    async def _send_read_request(self, data_ref: str, type_str: str) -> bytes | None:
+        """
+        Send a read request for a data reference and await its response.
+
+        Args:
+            data_ref (str): Data reference name (e.g., "sim/cockpit2/controls/parking_brake_ratio").
+            type_str (str): Type of the data reference (e.g., "int", "float", "[int]", "[float]").
+
+        Returns:
+            bytes | None: The response record, or None if no response was received.
+        """
+        request_id = _next_request_id()
+        data = request_id + _encode_read_request(type_str, data_ref)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending dataref read request: %s", data.decode())
+        response = await self.client.send_and_recv(request_id, data)
         if response:
-            response_body = response.decode().strip()
-            print(colored(f"Received dataref read response body: {response_body}", "yellow"))
-            value = response_body.split("|")[-1]
-            return value
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received dataref read response body: %s", str(response, "utf-8").strip())
+            return response
         else:
-            print(colored(f"Dataref {data_ref} read failed: no response from server", "red"))
+            logger.error("Dataref %s read failed: no response from server", data_ref)
             return None
+
+    async def read_many(self, data_refs: list[tuple[str, str]]) -> dict[str, str | None]:
+        """
+        Read multiple data references concurrently.
+
+        All read requests are sent at once and their responses are awaited together,
+        so the whole batch takes about one roundtrip.
+
+        Args:
+            data_refs (list[tuple[str, str]]): Pairs of data reference name and type
+                                               (e.g., ("sim/cockpit2/controls/parking_brake_ratio", "float")).
+
+        Returns:
+            dict[str, str | None]: The string value of each data reference keyed by its name,
+                                   a value is None if reading it failed.
+
+        Example:
+            >>> reader = AsyncDataRefReader(client)
+            >>> values = await reader.read_many([("sim/cockpit2/controls/parking_brake_ratio", "float")])
+        """
+        values = await asyncio.gather(*(self.read(data_ref, type_str) for data_ref, type_str in data_refs))
+        return {data_ref: value for (data_ref, _), value in zip(data_refs, values, strict=True)}
@@ -1,30 +1,43 @@
-import time
+import asyncio
+import logging
 
 from termcolor import colored
 
-from dataref import DataRefReader
-from udp import UdpClient
+from dataref import AsyncDataRefReader
+from udp import AsyncUdpClient
+
+# Colored once at import time, so the polling loop only fills in the placeholders
+READ_SUCCESS_MESSAGE = colored("Dataref %s successfully read as %s: %s", "green")
+
+
+async def main():
+    # Set the level to logging.DEBUG to trace every request and response
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 
-if __name__ == "__main__":
     # Create UDP client
-    client = UdpClient("127.0.0.1", 49000)
+    client = await AsyncUdpClient.create("127.0.0.1", 49000)
 
     # Create DataRefReader
-    dataref_reader = DataRefReader(client)
+    dataref_reader = AsyncDataRefReader(client)
 
-    while True:
-        # Read dataref value examples
-        data_refs = [
-            ("sim/cockpit2/controls/parking_brake_ratio", "float"),
-            ("sim/cockpit2/engine/actuators/throttle_ratio", "float"),
-            ("sim/cockpit2/engine/actuators/eng_master", "[int]"),
-            ("sim/cockpit2/electrical/battery_on", "[int]"),
-        ]
+    # Read dataref value examples
+    data_refs = [
+        ("sim/cockpit2/controls/parking_brake_ratio", "float"),
+        ("sim/cockpit2/engine/actuators/throttle_ratio", "float"),
+        ("sim/cockpit2/engine/actuators/eng_master", "[int]"),
+        ("sim/cockpit2/electrical/battery_on", "[int]"),
+    ]
 
+    while True:
+        values = await dataref_reader.read_many(data_refs)
         for data_ref, type_str in data_refs:
-            value = dataref_reader.read(data_ref, type_str)
+            value = values[data_ref]
             if value is not None:
-                print(colored(f"Dataref {data_ref} successfully read as {type_str}: {value}", "green"))
+                print(READ_SUCCESS_MESSAGE % (data_ref, type_str, value))
 
         # Sleep for a short duration to avoid overloading the server
-        time.sleep(3)
+        await asyncio.sleep(3)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
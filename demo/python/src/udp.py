@@ -7,13 +7,66 @@ It allows sending data requests and receiving responses from the XPlane simulati
 Example:
     >>> client = UdpClient("127.0.0.1", 49000)
     >>> response = client.send_and_recv(b"dataref|read|float|sim/cockpit2/controls/parking_brake_ratio")
-    >>> print(response)
+    >>> print(bytes(response))
     b'dataref|response|float|0.0'
+
+The AsyncUdpClient provides the same communication on top of asyncio, so that many requests can be in flight
+at the same time and a batch of requests costs a single roundtrip instead of one roundtrip per request.
 """
 
+import asyncio
+import logging
+import selectors
 import socket
+import sys
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Large enough to hold bursts of responses, e.g. to batched requests, without the kernel dropping datagrams
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Linux values of IP_MTU_DISCOVER, IP_PMTUDISC_DO and IP_MTU from <linux/in.h>, the socket module does not expose them
+_IP_MTU_DISCOVER = 10
+_IP_PMTUDISC_DO = 2
+_IP_MTU = 14
 
-from termcolor import colored
+# Sizes of the IPv4 and UDP headers that precede the payload of every datagram
+_IP_UDP_HEADER_SIZE = 20 + 8
+
+# Largest payload that fits the 1500-byte Ethernet MTU, used where the path MTU is unknown
+DEFAULT_MAX_DATAGRAM_SIZE = 1500 - _IP_UDP_HEADER_SIZE
+
+
+def _create_socket(server_addr: tuple[str, int]) -> socket.socket:
+    """
+    Create a UDP socket connected to the server, shared by UdpClient and AsyncUdpClient.
+
+    The receive and send buffer sizes are raised to SOCKET_BUFFER_SIZE. The operating system may cap them
+    (e.g. net.core.rmem_max on Linux), so the effective sizes are logged.
+    The client only talks to one server, so the socket is connected to it once here
+    instead of passing the address along with every datagram.
+
+    Args:
+        server_addr (tuple[str, int]): Tuple containing the server IP and port.
+
+    Returns:
+        socket.socket: The connected UDP socket.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+    logger.info(
+        "UDP socket buffer sizes: receive %d bytes, send %d bytes",
+        sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+        sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+    )
+    if sys.platform == "linux":
+        # Never fragment datagrams: a datagram larger than the path MTU, e.g. a large batch of requests,
+        # fails to send right away instead of being fragmented, where losing any fragment silently loses all of it
+        sock.setsockopt(socket.IPPROTO_IP, _IP_MTU_DISCOVER, _IP_PMTUDISC_DO)
+    sock.connect(server_addr)
+    return sock
 
 
 class UdpClient:
@@ -25,9 +78,12 @@ class UdpClient:
 
     Attributes:
         server_addr (tuple): Tuple containing the server IP and port.
-        socket (socket.socket): UDP socket for communication with the server.
+        timeout_secs (float): Time in seconds to wait for a response.
+        socket (socket.socket): Non-blocking UDP socket for communication with the server.
     """
 
+    RECV_BUFFER_SIZE = 65507
+
     def __init__(self, host: str, port: int, timeout_secs: float = 3):
         """
         Initialize UDP Client for XPlane UDP bridge plugin.
@@ -37,50 +93,280 @@ class UdpClient:
         Args:
             host (str): Server IP address (e.g., "127.0.0.1" for localhost).
             port (int): Server port number (e.g., 49000 for XPlane UDP bridge).
-            timeout_secs (float, optional): Socket timeout in seconds. Defaults to 3.
+            timeout_secs (float, optional): Time in seconds to wait for a response. Defaults to 3.
 
         Example:
             >>> client = UdpClient("127.0.0.1", 49000, 10)
             >>> print(client.server_addr)
             ('127.0.0.1', 49000)
         """
-        print("=" * 100)
-        print(colored(f"Creating UDP client to server {host}:{port} with timeout {timeout_secs} seconds", "cyan"))
+        logger.info("Creating UDP client to server %s:%d with timeout %s seconds", host, port, timeout_secs)
         self.server_addr = (host, port)
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.socket.settimeout(timeout_secs)
-        print(colored("Created UDP client successfully", "green"))
+        self.timeout_secs = timeout_secs
+        self.socket = _create_socket(self.server_addr)
+        # Waiting for responses with a selector registered once avoids the per-call readiness polling
+        # that a socket timeout implies on every blocking receive
+        self.socket.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.socket, selectors.EVENT_READ)
+        # Responses are received into one preallocated buffer instead of a new bytes object per response.
+        # Only the multi-record responses of DataRefReader.read_many and read_pipelined are parsed in place,
+        # a single read copies its short record out of the buffer again, so it saves nothing there
+        self._recv_buffer = bytearray(self.RECV_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buffer)
+        logger.info("Created UDP client successfully")
 
-    def send_and_recv(self, data: bytes) -> bytes | None:
+    def send_and_recv(self, data: bytes) -> memoryview | None:
         """
         Send data to the server and wait for a response.
 
-        Sends the provided data to the configured server address and waits for a response.
-        Handles timeout and general exceptions gracefully.
+        Sends the provided data to the connected server and waits for a response.
+        Returns None instead of raising if no response arrives within timeout_secs or the socket reports an OSError.
+
+        The response is a view into the receive buffer of this client, so it is only valid until the next call.
+        Copy it with bytes(response) to keep it longer.
 
         Args:
             data (bytes): Data to send to the server.
 
         Returns:
-            bytes | None: Response bytes from the server, or None if a timeout or error occurs.
+            memoryview | None: View of the response bytes from the server, or None if a timeout or error occurs.
 
         Example:
             >>> client = UdpClient("127.0.0.1", 49000)
             >>> response = client.send_and_recv(b"test_data")
             >>> if response:
-            ...     print("Received:", response)
+            ...     print("Received:", bytes(response))
             ... else:
             ...     print("No response received")
         """
         try:
-            self.socket.sendto(data, self.server_addr)
-        except Exception as e:
-            print(colored(f"UDP error while sending data: {e}", "red"))
+            self.socket.send(data)
+            if not self._selector.select(self.timeout_secs):
+                logger.error("UDP request timed out after %s seconds", self.timeout_secs)
+                return None
+            size = self.socket.recv_into(self._recv_buffer)
+            return self._recv_view[:size]
+        except OSError as e:
+            logger.error("UDP error while sending or receiving data: %s", e)
             return None
 
+    def max_datagram_size(self) -> int:
+        """
+        Get the largest datagram that can be sent to the server without IP fragmentation.
+
+        On Linux this is derived from the path MTU the kernel currently knows for the connected socket,
+        so it follows links with a smaller MTU than Ethernet, e.g. PPPoE or VPN tunnels. The kernel lowers it
+        when a router reports a smaller MTU, which makes the next too large send fail, so it is worth asking again
+        before every batch. Elsewhere the payload that fits the 1500-byte Ethernet MTU is assumed.
+
+        Returns:
+            int: Largest datagram payload in bytes.
+
+        Example:
+            >>> client = UdpClient("127.0.0.1", 49000)
+            >>> print(client.max_datagram_size())
+            65507
+        """
+        if sys.platform == "linux":
+            try:
+                mtu = self.socket.getsockopt(socket.IPPROTO_IP, _IP_MTU)
+                return min(mtu - _IP_UDP_HEADER_SIZE, self.RECV_BUFFER_SIZE)
+            except OSError as e:
+                logger.error("UDP error while querying the path MTU: %s", e)
+        return DEFAULT_MAX_DATAGRAM_SIZE
+
+    def send(self, data: bytes) -> bool:
+        """
+        Send data to the server without waiting for a response.
+
+        Together with recv, this allows several requests to be sent before their responses are received.
+
+        Args:
+            data (bytes): Data to send to the server.
+
+        Returns:
+            bool: True if the data was sent, False if an error occurs.
+
+        Example:
+            >>> client = UdpClient("127.0.0.1", 49000)
+            >>> if client.send(b"test_data"):
+            ...     response = client.recv()
+        """
+        try:
+            self.socket.send(data)
+            return True
+        except OSError as e:
+            logger.error("UDP error while sending data: %s", e)
+            return False
+
+    def recv(self, timeout: float | None = None) -> memoryview | None:
+        """
+        Wait for the next response from the server.
+
+        The response is a view into the receive buffer of this client, so it is only valid until the next call.
+        Copy it with bytes(response) to keep it longer.
+
+        Args:
+            timeout (float | None, optional): Time in seconds to wait for the response. Defaults to timeout_secs.
+
+        Returns:
+            memoryview | None: View of the response bytes from the server, or None if a timeout or error occurs.
+
+        Example:
+            >>> client = UdpClient("127.0.0.1", 49000)
+            >>> response = client.recv()
+        """
+        if timeout is None:
+            timeout = self.timeout_secs
         try:
-            response, _ = self.socket.recvfrom(2048)
-            return response
-        except Exception as e:
-            print(colored(f"UDP error while receiving data: {e}", "red"))
+            if not self._selector.select(timeout):
+                logger.error("UDP request timed out, no response within %.2f seconds", timeout)
+                return None
+            size = self.socket.recv_into(self._recv_buffer)
+            return self._recv_view[:size]
+        except OSError as e:
+            logger.error("UDP error while receiving data: %s", e)
+            return None
+
+
+class UdpClientProtocol(asyncio.DatagramProtocol):
+    """
+    asyncio datagram protocol for XPlane UDP bridge plugin.
+
+    This class keeps track of the outstanding requests and resolves each of them with its response.
+    Requests and responses are correlated by the request ID, which is the first field of every message.
+    A datagram may carry several newline-delimited response records, each of which resolves its own request.
+
+    Attributes:
+        pending (dict[bytes, asyncio.Future[bytes]]): Outstanding requests keyed by request ID.
+    """
+
+    def __init__(self):
+        """
+        Initialize the protocol with no outstanding requests.
+        """
+        self.pending: dict[bytes, asyncio.Future[bytes]] = {}
+
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        """
+        Resolve the outstanding requests answered by the received datagram.
+
+        Args:
+            data (bytes): Datagram received from the server.
+            addr (tuple[str | Any, int]): Address of the server.
+        """
+        for record in data.strip().split(b"\n"):
+            request_id, _, _ = record.partition(b"|")
+            future = self.pending.pop(request_id, None)
+            if future is not None and not future.done():
+                future.set_result(record)
+
+    def error_received(self, exc: Exception) -> None:
+        """
+        Report a socket error reported by the transport.
+
+        Args:
+            exc (Exception): The error raised by the underlying socket.
+        """
+        logger.error("UDP error while receiving data: %s", exc)
+
+
+class AsyncUdpClient:
+    """
+    asyncio UDP Client for XPlane UDP bridge plugin.
+
+    This class handles the communication with the XPlane UDP bridge plugin using the UDP protocol on top of asyncio.
+    Unlike UdpClient, it does not block while waiting for a response, so concurrent requests share one roundtrip.
+
+    Attributes:
+        server_addr (tuple): Tuple containing the server IP and port.
+        timeout_secs (float): Time in seconds to wait for a response.
+        transport (asyncio.DatagramTransport): Datagram transport connected to the server.
+        protocol (UdpClientProtocol): Protocol resolving the outstanding requests.
+    """
+
+    def __init__(
+        self,
+        server_addr: tuple[str, int],
+        timeout_secs: float,
+        transport: asyncio.DatagramTransport,
+        protocol: UdpClientProtocol,
+    ):
+        """
+        Initialize asyncio UDP Client from an already connected transport.
+
+        Use AsyncUdpClient.create to connect a new client.
+
+        Args:
+            server_addr (tuple[str, int]): Tuple containing the server IP and port.
+            timeout_secs (float): Time in seconds to wait for a response.
+            transport (asyncio.DatagramTransport): Datagram transport connected to the server.
+            protocol (UdpClientProtocol): Protocol resolving the outstanding requests.
+        """
+        self.server_addr = server_addr
+        self.timeout_secs = timeout_secs
+        self.transport = transport
+        self.protocol = protocol
+
+    @classmethod
+    async def create(cls, host: str, port: int, timeout_secs: float = 3) -> "AsyncUdpClient":
+        """
+        Create asyncio UDP Client for XPlane UDP bridge plugin.
+
+        Creates a datagram endpoint connected to the specified server.
+
+        Args:
+            host (str): Server IP address (e.g., "127.0.0.1" for localhost).
+            port (int): Server port number (e.g., 49000 for XPlane UDP bridge).
+            timeout_secs (float, optional): Time in seconds to wait for a response. Defaults to 3.
+
+        Returns:
+            AsyncUdpClient: The connected client.
+
+        Example:
+            >>> client = await AsyncUdpClient.create("127.0.0.1", 49000, 10)
+            >>> print(client.server_addr)
+            ('127.0.0.1', 49000)
+        """
+        logger.info("Creating async UDP client to server %s:%d with timeout %s seconds", host, port, timeout_secs)
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_datagram_endpoint(UdpClientProtocol, sock=_create_socket((host, port)))
+        logger.info("Created async UDP client successfully")
+        return cls((host, port), timeout_secs, transport, protocol)
+
+    async def send_and_recv(self, request_id: bytes, data: bytes) -> bytes | None:
+        """
+        Send a request to the server and wait for its response.
+
+        Other requests may be sent while this one is waiting, their responses are told apart by request ID.
+
+        Args:
+            request_id (bytes): ID of the request, used to match the response.
+            data (bytes): Data to send to the server.
+
+        Returns:
+            bytes | None: Response record from the server, or None if a timeout or error occurs.
+
+        Example:
+            >>> client = await AsyncUdpClient.create("127.0.0.1", 49000)
+            >>> request_id = b"0" * 32
+            >>> response = await client.send_and_recv(request_id, request_id + b"|dataref|read|int|test_data")
+            >>> if response:
+            ...     print("Received:", response)
+            ... else:
+            ...     print("No response received")
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.protocol.pending[request_id] = future
+        try:
+            self.transport.sendto(data)
+            return await asyncio.wait_for(future, self.timeout_secs)
+        except TimeoutError:
+            logger.error("UDP request %s timed out after %s seconds", request_id.decode(), self.timeout_secs)
+            return None
+        except OSError as e:
+            logger.error("UDP error while sending data: %s", e)
             return None
+        finally:
+            self.protocol.pending.pop(request_id, None)
@@ -13,6 +13,12 @@ struct UdpServer {
 }
 
 impl UdpServer {
+    const UUID_LENGTH: usize = 32;
+
+    const MAX_DATAGRAM_SIZE: usize = 65507;
+
+    const RECORD_SEPARATOR: &'static str = "\n";
+
     fn new() -> Self {
         Self { request_handlers: Arc::new(Mutex::new(Vec::new())) }
     }
@@ -45,7 +51,7 @@ impl UdpServer {
                     }
                 };
 
-                let mut buffer = vec![0u8; 2048];
+                let mut buffer = vec![0u8; Self::MAX_DATAGRAM_SIZE];
 
                 info!("UDP server started and listening on {}", addr);
 
@@ -58,48 +64,94 @@ impl UdpServer {
                         }
                     };
 
-                    // The first 32 bytes of the buffer are the UUID
-                    let uuid = String::from_utf8(buffer[..32].to_vec()).unwrap();
-
-                    // The rest bytes of the buffer is the message
-                    let message = match String::from_utf8(buffer[32..size].to_vec()) {
+                    let message = match std::str::from_utf8(&buffer[..size]) {
                         Ok(message) => message,
                         Err(e) => {
+                            // The first 32 bytes of the buffer are the UUID
+                            let uuid =
+                                String::from_utf8_lossy(&buffer[..Self::UUID_LENGTH.min(size)]);
                             let err_msg = format!("UDP server failed to parse message: {:?}", e);
                             error!("{}", err_msg);
-                            let response = UdpResponse::error(uuid, BadRequest, err_msg);
-                            Self::send_response(&socket, response, src).await;
-                            continue;
-                        }
-                    };
-
-                    let request = match UdpRequest::new(message) {
-                        Ok(request) => request,
-                        Err(e) => {
-                            let err_msg = format!("UDP server failed to parse request: {:?}", e);
-                            error!("{}", err_msg);
-                            let response = UdpResponse::error(uuid, BadRequest, err_msg);
-                            Self::send_response(&socket, response, src).await;
+                            let response =
+                                UdpResponse::error(uuid.to_string(), BadRequest, err_msg);
+                            Self::send_response(&socket, response.serialize(), src).await;
                             continue;
                         }
                     };
 
-                    match thread_safe_server.handle_request(request) {
-                        Ok(response) => {
-                            Self::send_response(&socket, UdpResponse::ok(uuid, response), src).await
-                        }
-                        Err(e) => {
-                            let err_msg = format!("UDP server failed to handle request: {:?}", e);
-                            error!("{}", err_msg);
-                            let response = UdpResponse::error(uuid, InternalServerError, err_msg);
-                            Self::send_response(&socket, response, src).await
-                        }
+                    for response in thread_safe_server.handle_message(message) {
+                        Self::send_response(&socket, response, src).await;
                     }
                 }
             });
         });
     }
 
+    fn handle_message(&self, message: &str) -> Vec<String> {
+        // A single datagram may carry several newline-delimited request records,
+        // all of them are answered in order, packed into as few response datagrams as the size allows.
+        // Empty records, e.g. after a trailing newline, are skipped
+        let mut datagrams = Vec::new();
+        let mut datagram = String::new();
+        for record in message.split(Self::RECORD_SEPARATOR).filter(|record| !record.is_empty()) {
+            let response = self.handle_record(record);
+            if !datagram.is_empty() {
+                if datagram.len() + Self::RECORD_SEPARATOR.len() + response.len()
+                    > Self::MAX_DATAGRAM_SIZE
+                {
+                    datagrams.push(std::mem::take(&mut datagram));
+                } else {
+                    datagram.push_str(Self::RECORD_SEPARATOR);
+                }
+            }
+            datagram.push_str(&response);
+        }
+        if !datagram.is_empty() {
+            datagrams.push(datagram);
+        }
+        datagrams
+    }
+
+    fn handle_record(&self, record: &str) -> String {
+        // The first 32 bytes of the record are the UUID, and the rest bytes are the message
+        let Some((uuid, message)) = record.split_at_checked(Self::UUID_LENGTH) else {
+            let err_msg = format!("UDP server failed to parse record: {}", record);
+            error!("{}", err_msg);
+            return UdpResponse::error(String::new(), BadRequest, err_msg).serialize();
+        };
+
+        let response = self.handle_record_message(uuid.to_string(), message).serialize();
+        if response.len() <= Self::MAX_DATAGRAM_SIZE {
+            return response;
+        }
+
+        // A response that does not fit into any datagram is replaced by an error,
+        // so the client learns about it instead of waiting for a response that is never sent
+        let err_msg = format!("UDP server response is too large to send: {} bytes", response.len());
+        error!("{}", err_msg);
+        UdpResponse::error(uuid.to_string(), InternalServerError, err_msg).serialize()
+    }
+
+    fn handle_record_message(&self, uuid: String, message: &str) -> UdpResponse {
+        let request = match UdpRequest::new(message.to_string()) {
+            Ok(request) => request,
+            Err(e) => {
+                let err_msg = format!("UDP server failed to parse request: {:?}", e);
+                error!("{}", err_msg);
+                return UdpResponse::error(uuid, BadRequest, err_msg);
+            }
+        };
+
+        match self.handle_request(request) {
+            Ok(response) => UdpResponse::ok(uuid, response),
+            Err(e) => {
+                let err_msg = format!("UDP server failed to handle request: {:?}", e);
+                error!("{}", err_msg);
+                UdpResponse::error(uuid, InternalServerError, err_msg)
+            }
+        }
+    }
+
     fn handle_request(&self, request: UdpRequest) -> Result<String, Box<dyn std::error::Error>> {
         let request_handler_type = request.determine_handler_type();
         match self.request_handlers.try_lock() {
@@ -115,8 +167,8 @@ impl UdpServer {
         }
     }
 
-    async fn send_response(socket: &tokio::net::UdpSocket, response: UdpResponse, src: SocketAddr) {
-        if let Err(e) = socket.send_to(response.serialize().as_bytes(), src).await {
+    async fn send_response(socket: &tokio::net::UdpSocket, response: String, src: SocketAddr) {
+        if let Err(e) = socket.send_to(response.as_bytes(), src).await {
             error!("UDP server failed to send response: {:?}", e);
         }
     }
@@ -139,13 +191,81 @@ pub fn start(port: u16) {
 
 #[cfg(test)]
 mod tests {
+    use super::UdpServer;
     use crate::udp;
+    use crate::udp::handler::{UdpRequestHandler, UdpRequestHandlerType};
+    use crate::udp::request::UdpRequest;
     use std::panic::catch_unwind;
 
+    struct EchoRequestHandler;
+
+    impl UdpRequestHandler for EchoRequestHandler {
+        fn get_handler_type(&self) -> UdpRequestHandlerType {
+            UdpRequestHandlerType::DataRefReader
+        }
+
+        fn handle(&self, request: UdpRequest) -> Result<String, Box<dyn std::error::Error>> {
+            Ok(request.get_data())
+        }
+    }
+
+    fn new_echo_server() -> UdpServer {
+        let server = UdpServer::new();
+        server.request_handlers.lock().unwrap().push(Box::new(EchoRequestHandler));
+        server
+    }
+
     #[test]
     fn test_start_udp_server() {
         let port = 49000;
         let result = catch_unwind(|| udp::server::start(port));
         assert!(result.is_ok(), "test failed: udp server start should not panic");
     }
+
+    #[test]
+    fn test_handle_message_with_multiple_records() {
+        let message = format!("{:032}|dataref|read|float|a\n{:032}|dataref|read|int|b", 1, 2);
+        let response = new_echo_server().handle_message(&message);
+        let expected = vec![format!("{:032}|200|OK|a\n{:032}|200|OK|b", 1, 2)];
+        assert_eq!(response, expected, "test failed: every record should be answered in order");
+    }
+
+    #[test]
+    fn test_handle_message_with_record_shorter_than_uuid() {
+        let response = new_echo_server().handle_message("short");
+        let expected = vec!["|400|Bad Request|UDP server failed to parse record: short"];
+        assert_eq!(response, expected, "test failed: a short record should be a bad request");
+    }
+
+    #[test]
+    fn test_handle_message_with_trailing_newline() {
+        let message = format!("{:032}|dataref|read|float|a\n", 1);
+        let response = new_echo_server().handle_message(&message);
+        let expected = vec![format!("{:032}|200|OK|a", 1)];
+        assert_eq!(response, expected, "test failed: a trailing newline should not add a response");
+    }
+
+    #[test]
+    fn test_handle_message_with_responses_larger_than_datagram() {
+        let data = "a".repeat(UdpServer::MAX_DATAGRAM_SIZE / 2);
+        let message =
+            format!("{:032}|dataref|read|float|{}\n{:032}|dataref|read|float|{}", 1, data, 2, data);
+        let response = new_echo_server().handle_message(&message);
+        let expected =
+            vec![format!("{:032}|200|OK|{}", 1, data), format!("{:032}|200|OK|{}", 2, data)];
+        assert_eq!(response, expected, "test failed: responses should be split across datagrams");
+    }
+
+    #[test]
+    fn test_handle_message_with_response_larger_than_datagram() {
+        let data = "a".repeat(UdpServer::MAX_DATAGRAM_SIZE);
+        let message = format!("{:032}|dataref|read|float|{}", 1, data);
+        let response = new_echo_server().handle_message(&message);
+        let size = format!("{:032}|200|OK|{}", 1, data).len();
+        let expected = vec![format!(
+            "{:032}|500|Internal Server Error|UDP server response is too large to send: {} bytes",
+            1, size
+        )];
+        assert_eq!(response, expected, "test failed: an oversized response should be an error");
+    }
 }